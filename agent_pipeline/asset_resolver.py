@@ -4,7 +4,7 @@ import json
 import os
 import time
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, List
 
 from openai import OpenAI
 
@@ -64,7 +64,7 @@ def _extract_json_object(text: str) -> Dict[str, Any]:
         data = json.loads(text)
         if isinstance(data, dict):
             return data
-    except Exception:
+    except json.JSONDecodeError:
         pass
 
     left = text.find("{")
@@ -74,7 +74,7 @@ def _extract_json_object(text: str) -> Dict[str, Any]:
             data = json.loads(text[left : right + 1])
             if isinstance(data, dict):
                 return data
-        except Exception:
+        except json.JSONDecodeError:
             pass
 
     return {"selected_assets": []}
@@ -143,14 +143,15 @@ def _call_asset_selector(
                 input=[{"role": "user", "content": content}],
                 stream=True,
             )
-            text = ""
+            chunks: List[str] = []
             last_delta = time.time()
             for event in resp:
                 if time.time() - last_delta > 90:
                     break
                 if hasattr(event, "type") and event.type == "response.output_text.delta":
-                    text += event.delta
+                    chunks.append(event.delta)
                     last_delta = time.time()
+            text = "".join(chunks)
             if text.strip():
                 return _extract_json_object(text)
         except Exception:
@@ -164,7 +165,7 @@ def _call_asset_selector(
 def _validate_selected_assets(
     raw_assets: Any,
     *,
-    available_icons: List[str],
+    available_icons: AbstractSet[str],
     teaching_plan: Dict[str, Any],
     icon_dir: Path,
 ) -> List[Dict[str, str]]:
@@ -176,7 +177,6 @@ def _validate_selected_assets(
         for section in teaching_plan.get("sections", [])
         if isinstance(section, dict)
     }
-    available_set = set(available_icons)
     validated: List[Dict[str, str]] = []
     used_filenames: set[str] = set()
 
@@ -185,7 +185,7 @@ def _validate_selected_assets(
             continue
         filename = str(item.get("filename", "")).strip()
         section_id = str(item.get("section_id", "")).strip()
-        if filename not in available_set or section_id not in section_titles:
+        if filename not in available_icons or section_id not in section_titles:
             continue
         if filename in used_filenames:
             continue
@@ -225,7 +225,7 @@ def resolve_local_assets(
     )
     selected_assets = _validate_selected_assets(
         raw.get("selected_assets", []),
-        available_icons=available_icons,
+        available_icons=frozenset(available_icons),
         teaching_plan=teaching_plan,
         icon_dir=icon_dir,
     )
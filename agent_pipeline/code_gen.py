@@ -11,7 +11,7 @@ import base64
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from openai import OpenAI
 
@@ -600,15 +600,54 @@ def _extract_code(text: str) -> str:
     return text.strip()
 
 
+_IMAGE_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+
 def _image_to_data_url(path: Path) -> str:
     raw = path.read_bytes()
     b64 = base64.b64encode(raw).decode("ascii")
     suffix = path.suffix.lower().lstrip(".")
-    mime = {"png": "image/png", "jpg": "image/jpeg", "jpeg": "image/jpeg",
-            "gif": "image/gif", "webp": "image/webp"}.get(suffix, "image/png")
+    mime = _IMAGE_MIME_TYPES.get(suffix, "image/png")
     return f"data:{mime};base64,{b64}"
 
 
+# Failed-dimension name -> (heading, fix hints) for the refinement prompt.
+_DIMENSION_ADVICE: Dict[str, Tuple[str, str]] = {
+    "overlap": (
+        "OVERLAP",
+        "  → Elements are covering each other or extending off-screen.\n"
+        "  → FIX: Scale down, add spacing, FadeOut before new elements.\n"
+        "  → If needed, split one crowded slide into two slides while keeping the same content.\n",
+    ),
+    "layout": (
+        "LAYOUT",
+        "  → Screen is too crowded.\n"
+        "  → FIX: Show fewer elements simultaneously, use FadeOut stages.\n",
+    ),
+    "color_consistency": (
+        "COLOR",
+        "  → Abrupt colour jumps.\n"
+        "  → FIX: Use fewer colours, gradual transitions.\n",
+    ),
+    "animation": (
+        "ANIMATION",
+        "  → Motion is jerky.\n"
+        "  → FIX: Add self.wait() between animations, longer run_time.\n"
+        "  → Keep the page anchor fixed; avoid moving whole panels after entry.\n",
+    ),
+    "vlm_semantic": (
+        "VLM JUDGMENT",
+        "  → Vision model found visual problems.\n",
+    ),
+}
+
+
 def _build_actionable_feedback(eval_report: Dict) -> str:
     """Translate evaluation metrics into concrete, actionable instructions."""
     lines: List[str] = []
@@ -625,37 +664,10 @@ def _build_actionable_feedback(eval_report: Dict) -> str:
         if passed:
             continue
 
-        if name == "overlap":
-            lines.append(
-                f"**OVERLAP (score {dscore:.2f})**: {details}\n"
-                "  → Elements are covering each other or extending off-screen.\n"
-                "  → FIX: Scale down, add spacing, FadeOut before new elements.\n"
-                "  → If needed, split one crowded slide into two slides while keeping the same content.\n"
-            )
-        elif name == "layout":
-            lines.append(
-                f"**LAYOUT (score {dscore:.2f})**: {details}\n"
-                "  → Screen is too crowded.\n"
-                "  → FIX: Show fewer elements simultaneously, use FadeOut stages.\n"
-            )
-        elif name == "color_consistency":
-            lines.append(
-                f"**COLOR (score {dscore:.2f})**: {details}\n"
-                "  → Abrupt colour jumps.\n"
-                "  → FIX: Use fewer colours, gradual transitions.\n"
-            )
-        elif name == "animation":
-            lines.append(
-                f"**ANIMATION (score {dscore:.2f})**: {details}\n"
-                "  → Motion is jerky.\n"
-                "  → FIX: Add self.wait() between animations, longer run_time.\n"
-                "  → Keep the page anchor fixed; avoid moving whole panels after entry.\n"
-            )
-        elif name == "vlm_semantic":
-            lines.append(
-                f"**VLM JUDGMENT (score {dscore:.2f})**: {details}\n"
-                "  → Vision model found visual problems.\n"
-            )
+        advice = _DIMENSION_ADVICE.get(name)
+        if advice is not None:
+            label, hint = advice
+            lines.append(f"**{label} (score {dscore:.2f})**: {details}\n" + hint)
 
     for issue in eval_report.get("issues", []):
         vlm_reason = issue.get("vlm_reason", "")
@@ -722,15 +734,16 @@ class CodeGenAgent:
                     input=[{"role": "user", "content": full_content}],
                     stream=True,
                 )
-                text = ""
+                chunks: List[str] = []
                 start = _time.time()
                 for event in resp:
                     if _time.time() - start > 180:
                         print("  Stream timeout (180s) — aborting this attempt")
                         break
                     if hasattr(event, "type") and event.type == "response.output_text.delta":
-                        text += event.delta
+                        chunks.append(event.delta)
                         start = _time.time()
+                text = "".join(chunks)
                 if text.strip():
                     return text.strip()
                 raise TimeoutError("Empty response from API")
@@ -826,7 +839,7 @@ class CodeGenAgent:
             right = text.rfind("]")
             if left >= 0 and right > left:
                 return _json.loads(text[left:right + 1])
-        except Exception:
+        except _json.JSONDecodeError:
             pass
         return [p.strip() for p in raw.split("\n") if p.strip()]
 
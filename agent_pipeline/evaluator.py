@@ -10,7 +10,6 @@ uses a smaller step to avoid color/motion metric distortion from large gaps.
 
 from __future__ import annotations
 
-import json
 import math
 import sys
 from pathlib import Path
@@ -23,7 +22,8 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from eval_pipeline.config import CVConfig, FusionConfig, PipelineConfig, VLMConfig
-from eval_pipeline.run import evaluate_video
+from eval_pipeline.fusion import report_to_dict
+from eval_pipeline.run import evaluate_video_report
 
 
 def _auto_frame_step(video_path: Path, target_samples: int = 120) -> int:
@@ -111,16 +111,5 @@ def evaluate(
         skip_vlm=skip_vlm,
     )
 
-    evaluate_video(video_path, cfg)
-
-    report_path = output_dir / video_path.stem / "report.json"
-    if report_path.exists():
-        return json.loads(report_path.read_text(encoding="utf-8"))
-
-    return {
-        "video": video_path.name,
-        "overall_score": 0.0,
-        "overall_passed": False,
-        "dimensions": [],
-        "issues": [],
-    }
+    report = evaluate_video_report(video_path, cfg)
+    return report_to_dict(report)
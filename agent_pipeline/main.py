@@ -18,6 +18,7 @@ import argparse
 import ast
 import json
 import os
+import re
 import shutil
 import time
 from datetime import datetime
@@ -73,12 +74,14 @@ def _log(msg: str) -> None:
     print(f"[{ts}] {msg}")
 
 
+_TEX_CALL_RE = re.compile(r"(MathTex|Tex)\s*\(")
+_CJK_RUN_RE = re.compile(r"[\u4e00-\u9fff]+")
+
+
 def _detect_chinese_in_mathtex(code: str) -> str:
     """Scan code for Chinese chars inside MathTex/Tex and return a warning."""
-    import re
-
     issues = []
-    for match in re.finditer(r"(MathTex|Tex)\s*\(", code):
+    for match in _TEX_CALL_RE.finditer(code):
         start = match.end()
         depth = 1
         i = start
@@ -89,7 +92,7 @@ def _detect_chinese_in_mathtex(code: str) -> str:
                 depth -= 1
             i += 1
         fragment = code[start:i]
-        chinese = re.findall(r"[\u4e00-\u9fff]+", fragment)
+        chinese = _CJK_RUN_RE.findall(fragment)
         if chinese:
             issues.append(
                 f"  Found Chinese '{','.join(chinese)}' inside "
@@ -85,17 +85,20 @@ Rules:
 """
 
 
+_IMAGE_MIME_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "gif": "image/gif",
+    "webp": "image/webp",
+}
+
+
 def _image_to_data_url(path: Path) -> str:
     raw = path.read_bytes()
     b64 = base64.b64encode(raw).decode("ascii")
     suffix = path.suffix.lower().lstrip(".")
-    mime = {
-        "png": "image/png",
-        "jpg": "image/jpeg",
-        "jpeg": "image/jpeg",
-        "gif": "image/gif",
-        "webp": "image/webp",
-    }.get(suffix, "image/png")
+    mime = _IMAGE_MIME_TYPES.get(suffix, "image/png")
     return f"data:{mime};base64,{b64}"
 
 
@@ -110,7 +113,7 @@ def _extract_json_object(text: str) -> Dict:
         data = json.loads(text)
         if isinstance(data, dict):
             return data
-    except Exception:
+    except json.JSONDecodeError:
         pass
 
     match = re.search(r"\{.*\}", text, re.DOTALL)
@@ -180,6 +183,31 @@ def _normalize_sections(items: Any) -> List[Dict[str, str]]:
     return sections
 
 
+# Fallbacks for plans missing an arc or usable sections; copied per plan.
+_DEFAULT_NARRATIVE_ARC = (
+    "先让学生知道为什么要学",
+    "再把抽象概念变成画面",
+    "最后把画面收束成稳定结论",
+)
+
+_FALLBACK_SECTION: Dict[str, str] = {
+    "id": "section_1",
+    "title": "问题导入",
+    "teacher_goal": "先抓住学生真正的疑问，再给出这节课的路线。",
+    "teacher_move": "用一个贴近学生困惑的问题开场。",
+    "student_question": "这到底在讲什么，为什么会这样？",
+    "why_this_step_now": "学生先得知道自己为什么要继续看下去。",
+    "expected_student_reaction": "愿意跟着老师继续往下看。",
+    "concrete_example": "从最直观的现象或生活画面切入。",
+    "visual_strategy": "用一个简单画面建立问题情境。",
+    "board_plan": "标题、问题、学习路线三件事。",
+    "narration_goal": "像老师在黑板前先把任务交代清楚。",
+    "key_takeaway": "先知道问题，再进入理解过程。",
+    "check_for_understanding": "你现在最想先弄懂哪一步？",
+    "transition": "接下来把这个问题拆开看。",
+}
+
+
 def _normalize_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
     closing_raw = plan.get("closing") if isinstance(plan.get("closing"), dict) else {}
     normalized = {
@@ -189,11 +217,7 @@ def _normalize_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
         "hook": _text(plan.get("hook"), "先从学生最困惑的一句话切入。"),
         "big_idea": _text(plan.get("big_idea"), "把现象、图像和结论连成一条因果线。"),
         "teacher_voice": _text(plan.get("teacher_voice"), "像经验丰富的老师，先共情困惑，再一步步带学生看懂。"),
-        "narrative_arc": plan.get("narrative_arc") if isinstance(plan.get("narrative_arc"), list) else [
-            "先让学生知道为什么要学",
-            "再把抽象概念变成画面",
-            "最后把画面收束成稳定结论",
-        ],
+        "narrative_arc": plan.get("narrative_arc") if isinstance(plan.get("narrative_arc"), list) else list(_DEFAULT_NARRATIVE_ARC),
         "misconceptions": _normalize_misconceptions(plan.get("misconceptions")),
         "sections": _normalize_sections(plan.get("sections")),
         "closing": {
@@ -204,22 +228,7 @@ def _normalize_plan(plan: Dict[str, Any]) -> Dict[str, Any]:
     }
 
     if not normalized["sections"]:
-        normalized["sections"] = [{
-            "id": "section_1",
-            "title": "问题导入",
-            "teacher_goal": "先抓住学生真正的疑问，再给出这节课的路线。",
-            "teacher_move": "用一个贴近学生困惑的问题开场。",
-            "student_question": "这到底在讲什么，为什么会这样？",
-            "why_this_step_now": "学生先得知道自己为什么要继续看下去。",
-            "expected_student_reaction": "愿意跟着老师继续往下看。",
-            "concrete_example": "从最直观的现象或生活画面切入。",
-            "visual_strategy": "用一个简单画面建立问题情境。",
-            "board_plan": "标题、问题、学习路线三件事。",
-            "narration_goal": "像老师在黑板前先把任务交代清楚。",
-            "key_takeaway": "先知道问题，再进入理解过程。",
-            "check_for_understanding": "你现在最想先弄懂哪一步？",
-            "transition": "接下来把这个问题拆开看。",
-        }]
+        normalized["sections"] = [dict(_FALLBACK_SECTION)]
 
     return normalized
 
@@ -252,15 +261,15 @@ class TeachingPlannerAgent:
                     input=[{"role": "user", "content": full_content}],
                     stream=True,
                 )
-                text = ""
+                chunks: List[str] = []
                 last_chunk = time.time()
                 for event in resp:
                     if time.time() - last_chunk > 180:
                         break
                     if hasattr(event, "type") and event.type == "response.output_text.delta":
-                        text += event.delta
+                        chunks.append(event.delta)
                         last_chunk = time.time()
-                return _normalize_plan(_extract_json_object(text))
+                return _normalize_plan(_extract_json_object("".join(chunks)))
             except Exception:
                 if attempt == 2:
                     raise
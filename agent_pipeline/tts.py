@@ -7,6 +7,8 @@ Generates narration audio from text, then merges with video using ffmpeg.
 from __future__ import annotations
 
 import asyncio
+import functools
+import re
 import shutil
 import subprocess
 import tempfile
@@ -19,6 +21,8 @@ VOICE_EN = "en-US-AriaNeural"
 LOCAL_VOICE_ZH = "Tingting"
 LOCAL_VOICE_EN = "Samantha"
 
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
 
 async def _generate_audio_async(
     text: str,
@@ -32,14 +36,20 @@ async def _generate_audio_async(
     await communicate.save(str(output_path))
 
 
+@functools.lru_cache(maxsize=None)
+def _which(tool: str) -> Optional[str]:
+    """shutil.which, resolved once per tool instead of re-walking PATH per clip."""
+    return shutil.which(tool)
+
+
 def _supports_macos_say() -> bool:
-    return shutil.which("say") is not None and shutil.which("ffmpeg") is not None
+    return _which("say") is not None and _which("ffmpeg") is not None
 
 
 def _is_valid_audio_file(path: Path) -> bool:
     if not path.exists() or path.stat().st_size <= 0:
         return False
-    if not shutil.which("ffprobe"):
+    if not _which("ffprobe"):
         return True
     cmd = [
         "ffprobe",
@@ -66,7 +76,7 @@ def _is_valid_audio_file(path: Path) -> bool:
 
 
 def has_audio_stream(path: Path) -> bool:
-    if not path.exists() or not shutil.which("ffprobe"):
+    if not path.exists() or not _which("ffprobe"):
         return False
     cmd = [
         "ffprobe",
@@ -95,7 +105,7 @@ def has_audio_stream(path: Path) -> bool:
 
 
 def _local_voice_for(text: str, voice: str) -> str:
-    if "zh" in voice.lower() or any("\u4e00" <= ch <= "\u9fff" for ch in text):
+    if "zh" in voice.lower() or _CJK_RE.search(text):
         return LOCAL_VOICE_ZH
     return LOCAL_VOICE_EN
 
@@ -220,7 +230,7 @@ def merge_audio_video(
     If audio is shorter than video, it ends naturally (no looping).
     If audio is longer than video, video determines the length.
     """
-    if not shutil.which("ffmpeg"):
+    if not _which("ffmpeg"):
         print("  ffmpeg not found — skipping audio merge")
         return False
 
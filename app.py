@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import mimetypes
 import os
+import shutil
 import threading
 import traceback
 import uuid
@@ -86,7 +87,8 @@ class AppHandler(BaseHTTPRequestHandler):
     def _read_json(self) -> Dict[str, Any]:
         length = int(self.headers.get("Content-Length", "0"))
         raw = self.rfile.read(length) if length > 0 else b"{}"
-        return json.loads(raw.decode("utf-8"))
+        # json.loads sniffs the encoding (and a UTF-8 BOM) from bytes itself.
+        return json.loads(raw)
 
     def _send_json(self, payload: Dict[str, Any], status: int = HTTPStatus.OK) -> None:
         raw = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
@@ -101,13 +103,15 @@ class AppHandler(BaseHTTPRequestHandler):
             self._send_json({"error": "video not found"}, status=HTTPStatus.NOT_FOUND)
             return
         mime, _ = mimetypes.guess_type(str(path))
-        content = path.read_bytes()
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-Type", mime or "application/octet-stream")
-        self.send_header("Content-Length", str(len(content)))
-        self.send_header("Content-Disposition", f'inline; filename="{path.name}"')
-        self.end_headers()
-        self.wfile.write(content)
+        with path.open("rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", mime or "application/octet-stream")
+            self.send_header("Content-Length", str(size))
+            self.send_header("Content-Disposition", f'inline; filename="{path.name}"')
+            self.end_headers()
+            # Stream in chunks instead of holding the whole video in memory.
+            shutil.copyfileobj(f, self.wfile)
 
     def do_GET(self) -> None:
         parsed = urlparse(self.path)
@@ -1,3 +1,4 @@
+import functools
 from pathlib import Path
 
 import numpy as np
@@ -149,6 +150,27 @@ HL_ACCENT = YELLOW_300
 config.background_color = A4L_BG
 
 
+@functools.lru_cache(maxsize=8)
+def _icon_index(icon_dir):
+    """Index the files in *icon_dir* by lower-cased name and by stem, once per directory."""
+    by_name = {}
+    by_stem = {}
+    for candidate in Path(icon_dir).iterdir():
+        if not candidate.is_file():
+            continue
+        by_name.setdefault(candidate.name.lower(), candidate)
+        by_stem.setdefault(candidate.stem.lower(), []).append(candidate)
+    return by_name, by_stem
+
+
+@functools.lru_cache(maxsize=4)
+def _background_pixels(bg_path):
+    """Decode *bg_path* to an RGBA array once; callers must copy before use."""
+    # Normalize to RGBA before giving the pixels to Manim/Cairo.
+    with Image.open(bg_path) as image:
+        return np.array(image.convert("RGBA"))
+
+
 class AI4LearningBaseScene(NarratedScene):
     """Shared base scene for AI4Learning videos."""
 
@@ -160,11 +182,8 @@ class AI4LearningBaseScene(NarratedScene):
         if not bg_path.exists():
             return None
 
-        # Normalize to RGBA before giving the pixels to Manim/Cairo.
-        with Image.open(bg_path) as image:
-            rgba_pixels = np.array(image.convert("RGBA"))
-
-        bg_image = ImageMobject(rgba_pixels)
+        # ImageMobject may fade the array in place, so hand it a private copy.
+        bg_image = ImageMobject(_background_pixels(str(bg_path)).copy())
         bg_image.scale_to_fit_width(config.frame_width)
         if bg_image.height < config.frame_height:
             bg_image.scale_to_fit_height(config.frame_height)
@@ -194,12 +213,8 @@ class AI4LearningBaseScene(NarratedScene):
         return [bg_image] if bg_image is not None else []
 
     def clear_scene_keep_bg(self, run_time=0.7, wait_time=0.3):
-        persistent = self.get_persistent_mobjects()
-        to_fade = [
-            mob
-            for mob in self.mobjects
-            if all(mob is not keep for keep in persistent)
-        ]
+        persistent_ids = {id(mob) for mob in self.get_persistent_mobjects()}
+        to_fade = [mob for mob in self.mobjects if id(mob) not in persistent_ids]
         if to_fade:
             self.play(FadeOut(Group(*to_fade)), run_time=run_time)
         self._subtitle_mob = None
@@ -217,18 +232,12 @@ class AI4LearningBaseScene(NarratedScene):
         if exact_path.exists():
             return exact_path
 
-        requested_lower = requested.lower()
-        requested_stem = Path(requested).stem.lower()
-        stem_matches = []
-        for candidate in icon_dir.iterdir():
-            if not candidate.is_file():
-                continue
-            candidate_name = candidate.name.lower()
-            if candidate_name == requested_lower:
-                return candidate
-            if candidate.stem.lower() == requested_stem:
-                stem_matches.append(candidate)
+        by_name, by_stem = _icon_index(str(icon_dir))
+        name_match = by_name.get(requested.lower())
+        if name_match is not None:
+            return name_match
 
+        stem_matches = by_stem.get(Path(requested).stem.lower(), [])
         if len(stem_matches) == 1:
             return stem_matches[0]
 
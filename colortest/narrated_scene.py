@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import glob
 import hashlib
 import os
@@ -17,6 +18,22 @@ except ImportError:
     _HAS_MUTAGEN = False
 
 
+@functools.lru_cache(maxsize=None)
+def _has_ffprobe() -> bool:
+    return shutil.which("ffprobe") is not None
+
+
+@functools.lru_cache(maxsize=4)
+def _tts_cache_index(root: str) -> dict:
+    """Map digest -> mp3 for every ``**/tts_cache/*.mp3`` under *root*, walked once."""
+    index = {}
+    pattern = os.path.join(glob.escape(root), "**", "tts_cache", "*.mp3")
+    for path in glob.glob(pattern, recursive=True):
+        digest = os.path.splitext(os.path.basename(path))[0]
+        index.setdefault(digest, path)
+    return index
+
+
 class NarratedScene(Scene):
     SUBTITLE_SAFE_BOTTOM = -0.9
     CONTENT_TOP_LIMIT = 2.95
@@ -37,7 +54,7 @@ class NarratedScene(Scene):
                 return MP3(fp).info.length
             except Exception:
                 pass
-        if shutil.which("ffprobe"):
+        if _has_ffprobe():
             cmd = [
                 "ffprobe",
                 "-v",
@@ -65,14 +82,11 @@ class NarratedScene(Scene):
 
     def speak(self, text: str) -> float:
         digest = hashlib.md5(text.encode("utf-8")).hexdigest()
-        candidates = glob.glob(os.path.join("tts_cache", f"{digest}.mp3"))
-        if not candidates:
-            candidates = glob.glob(
-                os.path.join("**", "tts_cache", f"{digest}.mp3"),
-                recursive=True,
-            )
-        if candidates:
-            fp = os.path.abspath(candidates[0])
+        fp = os.path.join("tts_cache", f"{digest}.mp3")
+        if not os.path.isfile(fp):
+            fp = _tts_cache_index(os.getcwd()).get(digest)
+        if fp:
+            fp = os.path.abspath(fp)
             try:
                 self.add_sound(fp)
                 return self._audio_duration(fp, text)
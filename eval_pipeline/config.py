@@ -16,9 +16,12 @@ from typing import Dict, List, Optional, Tuple
 # Layer 1 – Classic CV feature extraction
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CVConfig:
-    """Parameters for per-frame CV feature extraction."""
+    """Parameters for per-frame CV feature extraction.
+
+    Frozen: one instance is shared read-only by every extraction stage.
+    """
 
     # --- HSV masks (text / solid / dark) ---
     text_max_sat: int = 48
@@ -111,6 +114,7 @@ class VLMConfig:
     temperature: float = 0.0
     max_tokens: int = 1024
     max_segments: int = 0                   # 0 = no limit
+    max_workers: int = 4                    # concurrent segment requests
     include_cv_fail: bool = True            # also send cv_fail to VLM
     keyframes_per_segment: int = 3          # start / mid / end
 
@@ -15,8 +15,12 @@ Dimensions covered:
 
 from __future__ import annotations
 
+import bisect
 import csv
+import functools
+import importlib.util
 import math
+import operator
 import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -27,20 +31,16 @@ import numpy as np
 
 from .config import CVConfig
 
-# Optional OCR dependency – gracefully degrade if unavailable.
-try:
-    import pytesseract
-
-    _HAS_TESSERACT = True
-except ImportError:
-    _HAS_TESSERACT = False
+# Optional OCR dependency – gracefully degrade if unavailable.  Only probe
+# for it here; the (heavy) import happens on first OCR use.
+_HAS_TESSERACT = importlib.util.find_spec("pytesseract") is not None
 
 
 # =====================================================================
 # Data containers
 # =====================================================================
 
-@dataclass
+@dataclass(slots=True)
 class FrameFeatures:
     """Per-frame feature vector."""
 
@@ -93,7 +93,7 @@ class FrameFeatures:
     candidate: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class SegmentFeatures:
     """Aggregated features for a temporal segment."""
 
@@ -163,29 +163,31 @@ def _ensure_odd(k: int) -> int:
     return k if k % 2 == 1 else k + 1
 
 
-def _mask_centroid(mask: np.ndarray) -> Tuple[Optional[float], Optional[float]]:
-    ys, xs = np.where(mask)
-    if xs.size == 0:
-        return None, None
-    return float(xs.mean()), float(ys.mean())
+@functools.lru_cache(maxsize=16)
+def _ellipse_kernel(k: int) -> np.ndarray:
+    """Elliptical structuring element of size *k*, built once per size."""
+    return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k, k))
 
 
-def _mask_bbox(mask: np.ndarray) -> Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]:
-    ys, xs = np.where(mask)
+def _mask_centroid_bbox(
+    mask: np.ndarray,
+) -> Tuple[Tuple[Optional[float], Optional[float]], Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]]:
+    """Return ``((cx, cy), (x1, y1, x2, y2))`` of *mask* from a single coordinate scan."""
+    ys, xs = np.nonzero(mask)
     if xs.size == 0:
-        return None, None, None, None
-    return int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1
+        return (None, None), (None, None, None, None)
+    centroid = (float(xs.mean()), float(ys.mean()))
+    bbox = (int(xs.min()), int(ys.min()), int(xs.max()) + 1, int(ys.max()) + 1)
+    return centroid, bbox
 
 
-def _frame_motion(prev: np.ndarray, cur: np.ndarray, thresh: float) -> int:
-    diff = cur.astype(np.float32) - prev.astype(np.float32)
-    dist = np.linalg.norm(diff, axis=2)
-    return int((dist >= thresh).sum())
+def _frame_delta(prev_f32: np.ndarray, cur_f32: np.ndarray) -> np.ndarray:
+    """Per-pixel Euclidean BGR distance between two float32 frames."""
+    return np.linalg.norm(cur_f32 - prev_f32, axis=2)
 
 
-def _color_histogram(frame: np.ndarray, bins: int) -> np.ndarray:
-    """Compute a normalised HSV hue-saturation histogram."""
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+def _color_histogram(hsv: np.ndarray, bins: int) -> np.ndarray:
+    """Compute a normalised hue-saturation histogram of an HSV frame."""
     hist = cv2.calcHist([hsv], [0, 1], None, [bins, bins], [0, 180, 0, 256])
     cv2.normalize(hist, hist)
     return hist.flatten().astype(np.float32)
@@ -200,11 +202,9 @@ def _chi_square_dist(h1: np.ndarray, h2: np.ndarray) -> float:
 # =====================================================================
 
 def _extract_masks(
-    frame: np.ndarray, cfg: CVConfig
+    hsv: np.ndarray, cfg: CVConfig
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
     """Return (text_mask, solid_main, dark_mask) as boolean arrays."""
-    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-
     text = (hsv[:, :, 1] <= cfg.text_max_sat) & (hsv[:, :, 2] >= cfg.text_min_val)
     solid = (hsv[:, :, 1] >= cfg.solid_min_sat) & (hsv[:, :, 2] >= cfg.solid_min_val)
     dark = (hsv[:, :, 1] <= cfg.dark_max_sat) & (hsv[:, :, 2] <= cfg.dark_max_val)
@@ -212,53 +212,56 @@ def _extract_masks(
     solid_u8 = solid.astype(np.uint8) * 255
     k_open = _ensure_odd(max(3, cfg.solid_open_k))
     k_close = _ensure_odd(max(5, cfg.solid_close_k))
-    open_k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_open, k_open))
-    close_k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (k_close, k_close))
-    solid_main = cv2.morphologyEx(solid_u8, cv2.MORPH_OPEN, open_k)
-    solid_main = cv2.morphologyEx(solid_main, cv2.MORPH_CLOSE, close_k) > 0
+    solid_main = cv2.morphologyEx(solid_u8, cv2.MORPH_OPEN, _ellipse_kernel(k_open))
+    solid_main = cv2.morphologyEx(solid_main, cv2.MORPH_CLOSE, _ellipse_kernel(k_close)) > 0
 
     return text, solid_main, dark
 
 
-def _layout_density(frame: np.ndarray, cfg: CVConfig) -> Tuple[float, int]:
+def _layout_density(gray: np.ndarray, cfg: CVConfig) -> Tuple[float, int]:
     """Compute grid-based foreground density."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     _, fg = cv2.threshold(gray, 30, 255, cv2.THRESH_BINARY)
 
     h, w = fg.shape
     rh = max(1, h // cfg.layout_grid_rows)
     rw = max(1, w // cfg.layout_grid_cols)
 
-    max_density = 0.0
-    dense_count = 0
-    for r in range(cfg.layout_grid_rows):
-        for c in range(cfg.layout_grid_cols):
-            cell = fg[r * rh : (r + 1) * rh, c * rw : (c + 1) * rw]
-            cell_area = max(cell.shape[0] * cell.shape[1], 1)
-            density = float(np.count_nonzero(cell)) / cell_area
-            if density > max_density:
-                max_density = density
-            if density >= cfg.layout_density_warn:
-                dense_count += 1
+    # View the frame as a (rows, rh, cols, rw) block grid and count every
+    # cell at once.  Cells past a tiny frame's edge are zero-padded, which
+    # keeps their density at 0 as before.
+    gh, gw = cfg.layout_grid_rows * rh, cfg.layout_grid_cols * rw
+    grid = fg[:gh, :gw]
+    if grid.shape != (gh, gw):
+        grid = np.pad(grid, ((0, gh - grid.shape[0]), (0, gw - grid.shape[1])))
+    counts = np.count_nonzero(
+        grid.reshape(cfg.layout_grid_rows, rh, cfg.layout_grid_cols, rw), axis=(1, 3)
+    )
+    densities = counts / (rh * rw)
 
+    max_density = float(densities.max()) if densities.size else 0.0
+    dense_count = int(np.count_nonzero(densities >= cfg.layout_density_warn))
     return max_density, dense_count
 
 
-def _count_components(frame: np.ndarray, min_area: int) -> int:
+def _count_components(stats: np.ndarray, min_area: int) -> int:
     """Count foreground connected components above *min_area*."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    _, fg = cv2.threshold(gray, 30, 255, cv2.THRESH_BINARY)
-    n_labels, _, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
-    count = 0
-    for i in range(1, n_labels):
-        if int(stats[i, cv2.CC_STAT_AREA]) >= min_area:
-            count += 1
-    return count
+    return int(np.count_nonzero(stats[1:, cv2.CC_STAT_AREA] >= min_area))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_pytesseract():
+    """Import pytesseract once; None if it cannot be imported."""
+    try:
+        import pytesseract
+    except ImportError:
+        return None
+    return pytesseract
 
 
 def _ocr_region_text(frame: np.ndarray, bbox: Tuple[int, int, int, int], lang: str) -> str:
     """Run Tesseract on a cropped region.  Returns empty string on failure."""
-    if not _HAS_TESSERACT:
+    pytesseract = _load_pytesseract() if _HAS_TESSERACT else None
+    if pytesseract is None:
         return ""
     x1, y1, x2, y2 = bbox
     crop = frame[y1:y2, x1:x2]
@@ -272,11 +275,28 @@ def _ocr_region_text(frame: np.ndarray, bbox: Tuple[int, int, int, int], lang: s
 
 def _levenshtein_norm(a: str, b: str) -> float:
     """Normalised Levenshtein distance in [0, 1]."""
-    if not a and not b:
+    if a == b:
         return 0.0
     la, lb = len(a), len(b)
     if la == 0 or lb == 0:
         return 1.0
+    longest = max(la, lb)
+    # A shared prefix / suffix never changes the distance, so only run the
+    # DP on the differing core (consecutive OCR reads are usually near-equal).
+    n = min(la, lb)
+    start = 0
+    while start < n and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < n - start and a[la - 1 - end] == b[lb - 1 - end]:
+        end += 1
+    a = a[start:la - end]
+    b = b[start:lb - end]
+    if len(a) < len(b):
+        a, b = b, a
+    la, lb = len(a), len(b)
+    if lb == 0:
+        return la / longest
     # Simple DP
     prev = list(range(lb + 1))
     for i in range(1, la + 1):
@@ -285,46 +305,32 @@ def _levenshtein_norm(a: str, b: str) -> float:
             cost = 0 if a[i - 1] == b[j - 1] else 1
             cur[j] = min(cur[j - 1] + 1, prev[j] + 1, prev[j - 1] + cost)
         prev = cur
-    return prev[lb] / max(la, lb)
+    return prev[lb] / longest
 
 
 # =====================================================================
 # New overlap detectors (colour-agnostic)
 # =====================================================================
 
-@dataclass
-class _BBoxComp:
-    label: int
-    x: int
-    y: int
-    w: int
-    h: int
-    area: int
+def _label_foreground(gray: np.ndarray, fg_thresh: int = 30) -> Tuple[np.ndarray, np.ndarray]:
+    """Threshold and label the foreground once.  Returns (labels, stats)."""
+    _, fg = cv2.threshold(gray, fg_thresh, 255, cv2.THRESH_BINARY)
+    _, labels, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
+    return labels, stats
 
 
-def _get_fg_components(frame: np.ndarray, min_area: int, fg_thresh: int = 30) -> List[_BBoxComp]:
-    """Extract foreground connected components as bounding boxes."""
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    _, fg = cv2.threshold(gray, fg_thresh, 255, cv2.THRESH_BINARY)
-    n_labels, labels, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
-    comps = []
-    for i in range(1, n_labels):
-        area = int(stats[i, cv2.CC_STAT_AREA])
-        if area < min_area:
-            continue
-        comps.append(_BBoxComp(
-            label=i,
-            x=int(stats[i, cv2.CC_STAT_LEFT]),
-            y=int(stats[i, cv2.CC_STAT_TOP]),
-            w=int(stats[i, cv2.CC_STAT_WIDTH]),
-            h=int(stats[i, cv2.CC_STAT_HEIGHT]),
-            area=area,
-        ))
-    return comps
+def _get_fg_components(stats: np.ndarray, min_area: int) -> np.ndarray:
+    """Extract foreground connected components as bounding boxes.
+
+    Returns an ``(N, 5)`` int array of ``(x, y, w, h, area)`` rows, in label
+    order, for components with area >= *min_area*.
+    """
+    comps = stats[1:]
+    return comps[comps[:, cv2.CC_STAT_AREA] >= min_area]
 
 
 def _bbox_iou_overlap(
-    frame: np.ndarray, cfg: CVConfig
+    stats: np.ndarray, cfg: CVConfig
 ) -> Tuple[int, float]:
     """
     Detect overlapping foreground components via bounding-box IoU.
@@ -334,41 +340,39 @@ def _bbox_iou_overlap(
     if not cfg.bbox_iou_enabled:
         return 0, 0.0
 
-    comps = _get_fg_components(frame, cfg.bbox_min_area, cfg.fg_thresh)
+    comps = _get_fg_components(stats, cfg.bbox_min_area)
     if len(comps) < 2:
         return 0, 0.0
 
-    pairs = 0
-    max_iou = 0.0
-    for i in range(len(comps)):
-        for j in range(i + 1, len(comps)):
-            a, b = comps[i], comps[j]
-            # Intersection
-            ix1 = max(a.x, b.x)
-            iy1 = max(a.y, b.y)
-            ix2 = min(a.x + a.w, b.x + b.w)
-            iy2 = min(a.y + a.h, b.y + b.h)
-            if ix2 <= ix1 or iy2 <= iy1:
-                continue
-            inter = (ix2 - ix1) * (iy2 - iy1)
-            if inter < cfg.bbox_min_intersection:
-                continue
-            # IoU
-            union = a.w * a.h + b.w * b.h - inter
-            iou = inter / max(union, 1)
-            # Overlap ratio (intersection / smaller bbox)
-            smaller = min(a.w * a.h, b.w * b.h)
-            ratio = inter / max(smaller, 1)
-
-            if iou >= cfg.bbox_min_iou or ratio >= cfg.bbox_min_overlap_ratio:
-                pairs += 1
-                max_iou = max(max_iou, iou)
+    # Evaluate every (i < j) pair at once instead of a Python double loop.
+    x1 = comps[:, cv2.CC_STAT_LEFT].astype(np.int64)
+    y1 = comps[:, cv2.CC_STAT_TOP].astype(np.int64)
+    x2 = x1 + comps[:, cv2.CC_STAT_WIDTH]
+    y2 = y1 + comps[:, cv2.CC_STAT_HEIGHT]
+    box_area = (x2 - x1) * (y2 - y1)
+    ii, jj = np.triu_indices(len(comps), k=1)
+
+    # Intersection
+    iw = np.minimum(x2[ii], x2[jj]) - np.maximum(x1[ii], x1[jj])
+    ih = np.minimum(y2[ii], y2[jj]) - np.maximum(y1[ii], y1[jj])
+    inter = iw * ih
+    valid = (iw > 0) & (ih > 0) & (inter >= cfg.bbox_min_intersection)
+    # IoU
+    union = box_area[ii] + box_area[jj] - inter
+    iou = inter / np.maximum(union, 1)
+    # Overlap ratio (intersection / smaller bbox)
+    smaller = np.minimum(box_area[ii], box_area[jj])
+    ratio = inter / np.maximum(smaller, 1)
+
+    hit = valid & ((iou >= cfg.bbox_min_iou) | (ratio >= cfg.bbox_min_overlap_ratio))
+    pairs = int(np.count_nonzero(hit))
+    max_iou = float(iou[hit].max()) if pairs else 0.0
 
     return pairs, max_iou
 
 
 def _fg_pixel_overlap(
-    frame: np.ndarray, cfg: CVConfig
+    labels: np.ndarray, stats: np.ndarray, cfg: CVConfig
 ) -> int:
     """
     Detect pixel-level overlap between distinct foreground components.
@@ -379,29 +383,38 @@ def _fg_pixel_overlap(
     if not cfg.fg_pixel_overlap_enabled:
         return 0
 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-    _, fg = cv2.threshold(gray, cfg.fg_thresh, 255, cv2.THRESH_BINARY)
-    n_labels, labels, stats, _ = cv2.connectedComponentsWithStats(fg, connectivity=8)
-
     # Keep only significant components
-    valid = []
-    for i in range(1, n_labels):
-        if int(stats[i, cv2.CC_STAT_AREA]) >= cfg.bbox_min_area:
-            valid.append(i)
-
+    valid = np.flatnonzero(stats[1:, cv2.CC_STAT_AREA] >= cfg.bbox_min_area) + 1
     if len(valid) < 2:
         return 0
 
-    dk = _ensure_odd(cfg.fg_dilate_k)
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (dk, dk))
+    k = _ensure_odd(cfg.fg_dilate_k)
+    kernel = _ellipse_kernel(k)
+    r = k // 2
 
-    # Dilate each component and accumulate overlap count
+    # Dilation grows a component by at most r pixels on each side, so only
+    # components whose r-padded boxes touch another's can ever overlap.
     h, w = labels.shape
+    x0 = np.maximum(stats[valid, cv2.CC_STAT_LEFT] - r, 0)
+    y0 = np.maximum(stats[valid, cv2.CC_STAT_TOP] - r, 0)
+    x1 = np.minimum(stats[valid, cv2.CC_STAT_LEFT] + stats[valid, cv2.CC_STAT_WIDTH] + r, w)
+    y1 = np.minimum(stats[valid, cv2.CC_STAT_TOP] + stats[valid, cv2.CC_STAT_HEIGHT] + r, h)
+    touches = (
+        (np.maximum(x0[:, None], x0[None, :]) < np.minimum(x1[:, None], x1[None, :]))
+        & (np.maximum(y0[:, None], y0[None, :]) < np.minimum(y1[:, None], y1[None, :]))
+    )
+    np.fill_diagonal(touches, False)
+    near = np.flatnonzero(touches.any(axis=1))
+    if len(near) == 0:
+        return 0
+
+    # Dilate each candidate inside its padded box and accumulate coverage
     coverage = np.zeros((h, w), dtype=np.int32)
-    for lbl in valid:
-        comp_mask = (labels == lbl).astype(np.uint8) * 255
+    for i in near:
+        ys, xs = slice(y0[i], y1[i]), slice(x0[i], x1[i])
+        comp_mask = (labels[ys, xs] == valid[i]).astype(np.uint8) * 255
         dilated = cv2.dilate(comp_mask, kernel, iterations=1)
-        coverage += (dilated > 0).astype(np.int32)
+        coverage[ys, xs] += (dilated > 0).astype(np.int32)
 
     # Pixels covered by >= 2 components = overlap
     overlap_pixels = int((coverage >= 2).sum())
@@ -409,7 +422,7 @@ def _fg_pixel_overlap(
 
 
 def _text_on_edge_overlap(
-    frame: np.ndarray, cfg: CVConfig
+    gray: np.ndarray, cfg: CVConfig
 ) -> int:
     """
     Detect text/annotation overlapping lines or curves.
@@ -422,11 +435,10 @@ def _text_on_edge_overlap(
     if not cfg.text_line_cross_enabled:
         return 0
 
-    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     _, fg = cv2.threshold(gray, cfg.fg_thresh, 255, cv2.THRESH_BINARY)
 
     # "Thick" foreground: survives aggressive erosion → text / large shapes
-    thick_k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (7, 7))
+    thick_k = _ellipse_kernel(7)
     thick_eroded = cv2.erode(fg, thick_k, iterations=1)
     thick_mask = cv2.dilate(thick_eroded, thick_k, iterations=2) > 0  # restore + expand
 
@@ -434,8 +446,7 @@ def _text_on_edge_overlap(
     thin_mask = (fg > 0) & (~thick_mask)
 
     # Dilate thin mask slightly so nearby text triggers
-    dk = _ensure_odd(cfg.edge_dilate_k)
-    dilate_k = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (dk, dk))
+    dilate_k = _ellipse_kernel(_ensure_odd(cfg.edge_dilate_k))
     thin_dilated = cv2.dilate(thin_mask.astype(np.uint8) * 255, dilate_k, iterations=1) > 0
 
     # Overlap: thick (text) pixels that sit on dilated thin (line) regions
@@ -476,7 +487,7 @@ def extract_all_frames(
     step = max(1, cfg.frame_step)
     features: List[FrameFeatures] = []
 
-    prev_frame: Optional[np.ndarray] = None
+    prev_frame_f: Optional[np.ndarray] = None
     prev_solid: Optional[np.ndarray] = None
     prev_hist: Optional[np.ndarray] = None
     prev_components: int = 0
@@ -488,16 +499,23 @@ def extract_all_frames(
         if frame_idx % step == 0:
             ff = FrameFeatures(frame=frame_idx, sec=frame_idx / fps)
 
+            # Colour-space conversions shared by every detector below
+            hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            frame_f = frame.astype(np.float32)
+            # One labelling serves bbox IoU, fg overlap and (at the default
+            # threshold) lifecycle counting.
+            fg_labels, fg_stats = _label_foreground(gray, cfg.fg_thresh)
+
             # --- 1. Overlap / occlusion masks ---
-            text_mask, solid_main, dark_mask = _extract_masks(frame, cfg)
+            text_mask, solid_main, dark_mask = _extract_masks(hsv, cfg)
             text_on_solid = text_mask & solid_main
             ff.text_pixels = int(text_on_solid.sum())
             signal_mask = text_on_solid.copy()
 
-            if prev_frame is not None:
-                ff.motion_pixels = _frame_motion(prev_frame, frame, cfg.motion_diff_thresh)
-                delta = frame.astype(np.float32) - prev_frame.astype(np.float32)
-                delta_dist = np.linalg.norm(delta, axis=2)
+            if prev_frame_f is not None:
+                delta_dist = _frame_delta(prev_frame_f, frame_f)
+                ff.motion_pixels = int((delta_dist >= cfg.motion_diff_thresh).sum())
                 changed = delta_dist >= cfg.change_diff_thresh
 
                 if prev_solid is not None:
@@ -512,17 +530,18 @@ def extract_all_frames(
                 signal_mask = signal_mask | occ_mask | wr_mask
 
             ff.overlap_pixels = int(signal_mask.sum())
-            ff.cx, ff.cy = _mask_centroid(signal_mask)
-            ff.bbox_x1, ff.bbox_y1, ff.bbox_x2, ff.bbox_y2 = _mask_bbox(signal_mask)
+            (ff.cx, ff.cy), (ff.bbox_x1, ff.bbox_y1, ff.bbox_x2, ff.bbox_y2) = (
+                _mask_centroid_bbox(signal_mask)
+            )
 
             # --- 1b. BBox IoU overlap (colour-agnostic) ---
-            ff.bbox_overlap_pairs, ff.bbox_max_iou = _bbox_iou_overlap(frame, cfg)
+            ff.bbox_overlap_pairs, ff.bbox_max_iou = _bbox_iou_overlap(fg_stats, cfg)
 
             # --- 1c. Foreground pixel-level overlap (colour-agnostic) ---
-            ff.fg_overlap_pixels = _fg_pixel_overlap(frame, cfg)
+            ff.fg_overlap_pixels = _fg_pixel_overlap(fg_labels, fg_stats, cfg)
 
             # --- 1d. Text-on-line/curve cross detection ---
-            ff.text_on_edge_pixels = _text_on_edge_overlap(frame, cfg)
+            ff.text_on_edge_pixels = _text_on_edge_overlap(gray, cfg)
 
             # --- Candidate: ANY overlap method triggers ---
             hsv_candidate = ff.overlap_pixels >= cfg.candidate_min_pixels
@@ -532,12 +551,16 @@ def extract_all_frames(
             ff.candidate = hsv_candidate or bbox_candidate or fg_candidate or edge_candidate
 
             # --- 2. Layout density ---
-            ff.layout_max_density, ff.layout_dense_cells = _layout_density(frame, cfg)
+            ff.layout_max_density, ff.layout_dense_cells = _layout_density(gray, cfg)
 
             # --- 3. Element lifecycle (component count change) ---
-            n_comp = _count_components(frame, cfg.lifecycle_min_area)
+            if cfg.fg_thresh == 30:
+                lifecycle_stats = fg_stats
+            else:
+                _, lifecycle_stats = _label_foreground(gray, 30)
+            n_comp = _count_components(lifecycle_stats, cfg.lifecycle_min_area)
             ff.num_components = n_comp
-            if prev_frame is not None:
+            if prev_frame_f is not None:
                 appeared = max(0, n_comp - prev_components)
                 disappeared = max(0, prev_components - n_comp)
                 if disappeared > 0 and processed >= 2:
@@ -547,7 +570,7 @@ def extract_all_frames(
             prev_components = n_comp
 
             # --- 4. Colour consistency ---
-            hist = _color_histogram(frame, cfg.color_hist_bins)
+            hist = _color_histogram(hsv, cfg.color_hist_bins)
             if prev_hist is not None:
                 ff.color_shift = _chi_square_dist(prev_hist, hist)
             prev_hist = hist
@@ -570,7 +593,7 @@ def extract_all_frames(
                 prev_ocr_text = ocr_text
 
             # --- bookkeeping ---
-            prev_frame = frame
+            prev_frame_f = frame_f
             prev_solid = solid_main
             features.append(ff)
             processed += 1
@@ -592,6 +615,19 @@ def extract_all_frames(
 # Segment aggregation
 # =====================================================================
 
+_frame_of = operator.attrgetter("frame")
+
+
+def _frame_span(features: List[FrameFeatures], start: int, end: int) -> Tuple[int, int]:
+    """Index bounds ``[lo, hi)`` of the frames in ``[start, end]``.
+
+    *features* must be ordered by frame number, as extract_all_frames returns them.
+    """
+    lo = bisect.bisect_left(features, start, key=_frame_of)
+    hi = bisect.bisect_right(features, end, lo=lo, key=_frame_of)
+    return lo, hi
+
+
 def merge_candidate_frames(
     features: List[FrameFeatures],
     fps: float,
@@ -620,14 +656,14 @@ def merge_candidate_frames(
         if idx - prev <= max_gap:
             prev = idx
             continue
-        n_sampled = sum(1 for f in features if start <= f.frame <= prev)
-        if n_sampled >= min_len:
+        lo, hi = _frame_span(features, start, prev)
+        if hi - lo >= min_len:
             segments.append((start, prev))
         start = idx
         prev = idx
 
-    n_sampled = sum(1 for f in features if start <= f.frame <= prev)
-    if n_sampled >= min_len:
+    lo, hi = _frame_span(features, start, prev)
+    if hi - lo >= min_len:
         segments.append((start, prev))
 
     return segments
@@ -647,20 +683,31 @@ def compute_segment_features(
     the features list may be sparse, so we filter by frame-number range
     instead of slicing by list index.
     """
-    seg_frames = [f for f in features if start <= f.frame <= end]
+    lo, hi = _frame_span(features, start, end)
+    seg_frames = features[lo:hi]
     n = len(seg_frames)
 
-    overlaps = np.array([f.overlap_pixels for f in seg_frames], dtype=np.float32)
-    texts = np.array([f.text_pixels for f in seg_frames], dtype=np.float32)
-    occs = np.array([f.occlusion_pixels for f in seg_frames], dtype=np.float32)
-    motions = np.array([f.motion_pixels for f in seg_frames], dtype=np.float32)
-    densities = np.array([f.layout_max_density for f in seg_frames], dtype=np.float32)
-    dense_cells = np.array([f.layout_dense_cells for f in seg_frames], dtype=np.float32)
-    color_shifts = np.array([f.color_shift for f in seg_frames], dtype=np.float32)
-
-    centroids = np.array(
-        [[f.cx, f.cy] for f in seg_frames if f.cx is not None], dtype=np.float32
-    )
+    # Gather every per-frame metric in one pass (None centroids become NaN)
+    # instead of re-walking the segment once per metric.
+    table = np.array(
+        [
+            (
+                f.overlap_pixels, f.text_pixels, f.occlusion_pixels,
+                f.motion_pixels, f.layout_max_density, f.layout_dense_cells,
+                f.color_shift, f.cx, f.cy, f.flash_events,
+                f.bbox_overlap_pairs, f.bbox_max_iou, f.fg_overlap_pixels,
+                f.text_on_edge_pixels, f.ocr_artifact,
+            )
+            for f in seg_frames
+        ],
+        dtype=np.float64,
+    ).reshape(n, 15)
+    (overlaps, texts, occs, motions, densities, dense_cells,
+     color_shifts) = table[:, :7].T.astype(np.float32)
+    flashes, bbox_pairs, bbox_ious, fg_overlaps, text_on_edges, ocr_flags = table[:, 9:].T
+
+    centroids = table[:, 7:9]
+    centroids = centroids[~np.isnan(centroids[:, 0])].astype(np.float32)
     if centroids.shape[0] >= 2:
         centered = centroids - centroids.mean(axis=0, keepdims=True)
         jitter = float(np.sqrt((centered ** 2).sum(axis=1).mean()))
@@ -694,23 +741,21 @@ def compute_segment_features(
         layout_max_density_avg=float(densities.mean()),
         layout_dense_cell_avg=float(dense_cells.mean()),
         # lifecycle
-        total_flash_events=sum(f.flash_events for f in seg_frames),
+        total_flash_events=int(flashes.sum()),
         # colour
         color_shift_max=float(color_shifts.max()) if n > 0 else 0.0,
         color_shift_avg=float(color_shifts.mean()) if n > 0 else 0.0,
         # BBox IoU overlap
-        bbox_overlap_frame_ratio=float(
-            sum(1 for f in seg_frames if f.bbox_overlap_pairs > 0) / max(n, 1)
-        ),
-        bbox_max_iou_max=float(max((f.bbox_max_iou for f in seg_frames), default=0.0)),
+        bbox_overlap_frame_ratio=float(np.count_nonzero(bbox_pairs > 0) / max(n, 1)),
+        bbox_max_iou_max=float(bbox_ious.max()) if n > 0 else 0.0,
         # Foreground pixel overlap
-        fg_overlap_avg=float(np.array([f.fg_overlap_pixels for f in seg_frames]).mean()),
-        fg_overlap_max=int(max((f.fg_overlap_pixels for f in seg_frames), default=0)),
+        fg_overlap_avg=float(fg_overlaps.mean()),
+        fg_overlap_max=int(fg_overlaps.max()) if n > 0 else 0,
         # Text-on-edge
-        text_on_edge_avg=float(np.array([f.text_on_edge_pixels for f in seg_frames]).mean()),
-        text_on_edge_max=int(max((f.text_on_edge_pixels for f in seg_frames), default=0)),
+        text_on_edge_avg=float(text_on_edges.mean()),
+        text_on_edge_max=int(text_on_edges.max()) if n > 0 else 0,
         # OCR artifact
-        ocr_artifact_frames=sum(1 for f in seg_frames if f.ocr_artifact),
+        ocr_artifact_frames=int(np.count_nonzero(ocr_flags)),
     )
     return sf
 
@@ -719,6 +764,11 @@ def compute_segment_features(
 # Segment classification (rule-based)
 # =====================================================================
 
+LABEL_CV_FAIL = "cv_fail"
+LABEL_LIKELY_INTENTIONAL = "likely_intentional"
+LABEL_NEEDS_VLM = "needs_vlm"
+
+
 def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, str]:
     """
     Classify a segment into one of:
@@ -747,7 +797,7 @@ def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, st
     # --- Rendering artifact detected by OCR ---
     if ocr_af >= 2:
         score = min(1.0, 0.5 + 0.1 * ocr_af)
-        return "cv_fail", score, "rendering-artifact-ocr"
+        return LABEL_CV_FAIL, score, "rendering-artifact-ocr"
 
     # --- Colour-agnostic overlap: BBox IoU + fg pixel + text-on-edge ---
     # Strong bbox overlap during active animation → likely a real bug
@@ -765,7 +815,7 @@ def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, st
         if has_edge_signal:
             sub_scores.append(0.4 * min(2.0, toe_max / 100) + 0.2 * min(2.0, ar / 0.3))
         score = min(1.0, max(sub_scores) * 0.6 + 0.2 * min(2.0, d / max(cfg.risk_min_duration, 1e-6)))
-        return "cv_fail", score, "colour-agnostic-overlap"
+        return LABEL_CV_FAIL, score, "colour-agnostic-overlap"
 
     # If colour-agnostic signals exist but weaker → needs_vlm
     weak_agnostic = (bbox_fr >= 0.1 or fg_max >= 80 or toe_max >= 50) and d >= 0.3
@@ -774,14 +824,14 @@ def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, st
                     + 0.3 * min(2.0, fg_max / 150)
                     + 0.2 * min(2.0, toe_max / 80)
                     + 0.2 * min(2.0, d / 1.0))
-        return "needs_vlm", score, "weak-colour-agnostic-signal"
+        return LABEL_NEEDS_VLM, score, "weak-colour-agnostic-signal"
 
     # --- Text-dominant layout -> likely intentional ---
     if d >= cfg.intent_min_duration and td >= 2.0 and oratio <= 0.08:
         score = min(1.0, 0.45 * min(3.0, d / max(cfg.intent_min_duration, 1e-6))
                      + 0.35 * min(3.0, td / 2.0)
                      + 0.20 * min(3.0, 0.08 / max(oratio + 1e-6, 1e-6)))
-        return "likely_intentional", score, "text-dominant-layout"
+        return LABEL_LIKELY_INTENTIONAL, score, "text-dominant-layout"
 
     # --- Long + static + low jitter → likely intentional ---
     if (d >= cfg.intent_min_duration
@@ -793,7 +843,7 @@ def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, st
                     * (sr / max(cfg.intent_min_static_ratio, 1e-6))
                     * (max(cfg.intent_max_motion, 1.0) / max(mavg, 1.0))
                     * (max(cfg.intent_max_jitter, 1.0) / max(j + 1e-6, 1.0)))
-        return "likely_intentional", score, "long+static+low-jitter"
+        return LABEL_LIKELY_INTENTIONAL, score, "long+static+low-jitter"
 
     # --- High overlap + occlusion → cv_fail ---
     occ_dominant = sf.occlusion_avg >= 0.7 * max(sf.text_avg, 1.0)
@@ -808,21 +858,21 @@ def classify_segment(sf: SegmentFeatures, cfg: CVConfig) -> Tuple[str, float, st
                     + 0.15 * min(2.0, ar / max(cfg.risk_min_active_ratio, 1e-6))
                     + 0.10 * min(2.0, j / max(cfg.risk_min_jitter, 1e-6))
                     + 0.10 * min(2.0, oratio / max(cfg.risk_min_occlusion_ratio, 1e-6)))
-        return "cv_fail", score, "high-overlap/occlusion"
+        return LABEL_CV_FAIL, score, "high-overlap/occlusion"
 
     # --- Fallback: uncertain → needs VLM ---
     score = min(1.0, 0.4 * min(2.0, omax / max(cfg.risk_min_overlap, 1.0))
                 + 0.3 * min(2.0, d / max(cfg.risk_min_duration, 1e-6))
                 + 0.2 * min(2.0, j / max(cfg.risk_min_jitter, 1e-6))
                 + 0.1 * min(2.0, ar / max(cfg.risk_min_active_ratio, 1e-6)))
-    return "needs_vlm", score, "uncertain-pattern"
+    return LABEL_NEEDS_VLM, score, "uncertain-pattern"
 
 
 # =====================================================================
 # Global (video-level) CV metrics
 # =====================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GlobalCVMetrics:
     """Video-level aggregated CV metrics for fusion scoring."""
 
@@ -868,35 +918,49 @@ def compute_global_cv_metrics(
         duration_sec=n / fps,
     )
 
+    # Frame-level tallies, gathered in one pass
+    n_candidate = 0
+    n_ocr_artifact = 0
+    n_layout_dense = 0
+    n_flash = 0
+    n_color_shift = 0
+    color_shift_max = features[0].color_shift
+    motions: List[int] = []
+    for f in features:
+        n_candidate += f.candidate
+        n_ocr_artifact += f.ocr_artifact
+        n_layout_dense += f.layout_dense_cells > 0
+        n_flash += f.flash_events
+        if f.color_shift >= cfg.color_shift_thresh:
+            n_color_shift += 1
+        if f.color_shift > color_shift_max:
+            color_shift_max = f.color_shift
+        motions.append(f.motion_pixels)
+
     # Overlap
-    g.overlap_frame_ratio = sum(1 for f in features if f.candidate) / n
-    fail_segs = [s for s in segments if s.label == "cv_fail"]
+    g.overlap_frame_ratio = n_candidate / n
+    fail_segs = [s for s in segments if s.label == LABEL_CV_FAIL]
     g.cv_fail_count = len(fail_segs)
     g.cv_fail_duration_sec = sum(s.duration_sec for s in fail_segs)
 
     # Rendering artifact
-    g.ocr_artifact_total = sum(f.ocr_artifact for f in features)
+    g.ocr_artifact_total = n_ocr_artifact
 
     # Layout
-    g.layout_dense_frame_ratio = sum(
-        1 for f in features if f.layout_dense_cells > 0
-    ) / n
+    g.layout_dense_frame_ratio = n_layout_dense / n
 
     # Animation smoothness – detect motion energy spikes
-    motions = [f.motion_pixels for f in features]
     if len(motions) >= 3:
         m = np.array(motions, dtype=np.float32)
         diff = np.abs(np.diff(m))
         median_diff = float(np.median(diff)) + 1.0
         g.motion_discontinuity_count = int((diff > 10 * median_diff).sum())
 
-    g.flash_event_total = sum(f.flash_events for f in features)
+    g.flash_event_total = n_flash
 
     # Colour consistency
-    g.color_shift_max = max((f.color_shift for f in features), default=0.0)
-    g.color_shift_events = sum(
-        1 for f in features if f.color_shift >= cfg.color_shift_thresh
-    )
+    g.color_shift_max = color_shift_max
+    g.color_shift_events = n_color_shift
 
     return g
 
@@ -913,80 +977,97 @@ def _to_hhmmss(sec: float) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}.{ms:03d}"
 
 
+_FRAME_CSV_FIELDS = (
+    "frame", "sec", "hhmmss",
+    "overlap_pixels", "text_pixels", "occlusion_pixels", "write_pixels",
+    "bbox_overlap_pairs", "bbox_max_iou",
+    "fg_overlap_pixels",
+    "text_on_edge_pixels",
+    "motion_pixels",
+    "layout_max_density", "layout_dense_cells",
+    "num_components", "flash_events",
+    "color_shift",
+    "ocr_artifact",
+    "candidate",
+)
+
+
 def save_frame_csv(features: List[FrameFeatures], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "frame", "sec", "hhmmss",
-        "overlap_pixels", "text_pixels", "occlusion_pixels", "write_pixels",
-        "bbox_overlap_pairs", "bbox_max_iou",
-        "fg_overlap_pixels",
-        "text_on_edge_pixels",
-        "motion_pixels",
-        "layout_max_density", "layout_dense_cells",
-        "num_components", "flash_events",
-        "color_shift",
-        "ocr_artifact",
-        "candidate",
-    ]
     with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for ff in features:
-            w.writerow({
-                "frame": ff.frame,
-                "sec": round(ff.sec, 6),
-                "hhmmss": _to_hhmmss(ff.sec),
-                "overlap_pixels": ff.overlap_pixels,
-                "text_pixels": ff.text_pixels,
-                "occlusion_pixels": ff.occlusion_pixels,
-                "write_pixels": ff.write_pixels,
-                "bbox_overlap_pairs": ff.bbox_overlap_pairs,
-                "bbox_max_iou": round(ff.bbox_max_iou, 4),
-                "fg_overlap_pixels": ff.fg_overlap_pixels,
-                "text_on_edge_pixels": ff.text_on_edge_pixels,
-                "motion_pixels": ff.motion_pixels,
-                "layout_max_density": round(ff.layout_max_density, 4),
-                "layout_dense_cells": ff.layout_dense_cells,
-                "num_components": ff.num_components,
-                "flash_events": ff.flash_events,
-                "color_shift": round(ff.color_shift, 6),
-                "ocr_artifact": int(ff.ocr_artifact),
-                "candidate": int(ff.candidate),
-            })
+        w = csv.writer(f)
+        w.writerow(_FRAME_CSV_FIELDS)
+        # Positional rows in _FRAME_CSV_FIELDS order; no per-row dict.
+        w.writerows(
+            (
+                ff.frame,
+                round(ff.sec, 6),
+                _to_hhmmss(ff.sec),
+                ff.overlap_pixels,
+                ff.text_pixels,
+                ff.occlusion_pixels,
+                ff.write_pixels,
+                ff.bbox_overlap_pairs,
+                round(ff.bbox_max_iou, 4),
+                ff.fg_overlap_pixels,
+                ff.text_on_edge_pixels,
+                ff.motion_pixels,
+                round(ff.layout_max_density, 4),
+                ff.layout_dense_cells,
+                ff.num_components,
+                ff.flash_events,
+                round(ff.color_shift, 6),
+                int(ff.ocr_artifact),
+                int(ff.candidate),
+            )
+            for ff in features
+        )
+
+
+_SEGMENT_CSV_FIELDS = (
+    "segment_id", "label", "score", "reason",
+    "start_frame", "end_frame", "start_sec", "end_sec",
+    "start_hhmmss", "end_hhmmss",
+    "duration_sec", "frames",
+    "overlap_avg", "overlap_max", "overlap_p90",
+    "text_avg", "occlusion_avg", "occlusion_ratio", "text_dominance",
+    "motion_avg", "active_ratio", "static_ratio", "centroid_jitter",
+    "layout_max_density_avg", "layout_dense_cell_avg",
+    "total_flash_events",
+    "color_shift_max", "color_shift_avg",
+    "bbox_overlap_frame_ratio", "bbox_max_iou_max",
+    "fg_overlap_avg", "fg_overlap_max",
+    "text_on_edge_avg", "text_on_edge_max",
+    "ocr_artifact_frames",
+)
+
+# Float columns written rounded to 4 decimals.
+_SEGMENT_CSV_ROUNDED = frozenset({
+    "overlap_avg", "overlap_p90", "text_avg", "occlusion_avg",
+    "text_dominance", "motion_avg", "active_ratio", "static_ratio",
+    "centroid_jitter", "layout_max_density_avg", "layout_dense_cell_avg",
+    "color_shift_max", "color_shift_avg", "score",
+    "occlusion_ratio", "duration_sec", "start_sec", "end_sec",
+})
 
 
 def save_segment_csv(segments: List[SegmentFeatures], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "segment_id", "label", "score", "reason",
-        "start_frame", "end_frame", "start_sec", "end_sec",
-        "start_hhmmss", "end_hhmmss",
-        "duration_sec", "frames",
-        "overlap_avg", "overlap_max", "overlap_p90",
-        "text_avg", "occlusion_avg", "occlusion_ratio", "text_dominance",
-        "motion_avg", "active_ratio", "static_ratio", "centroid_jitter",
-        "layout_max_density_avg", "layout_dense_cell_avg",
-        "total_flash_events",
-        "color_shift_max", "color_shift_avg",
-        "bbox_overlap_frame_ratio", "bbox_max_iou_max",
-        "fg_overlap_avg", "fg_overlap_max",
-        "text_on_edge_avg", "text_on_edge_max",
-        "ocr_artifact_frames",
-    ]
     with path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
+        w = csv.writer(f)
+        w.writerow(_SEGMENT_CSV_FIELDS)
         for sf in segments:
-            row = {k: getattr(sf, k) for k in fieldnames if hasattr(sf, k)}
-            row["start_hhmmss"] = _to_hhmmss(sf.start_sec)
-            row["end_hhmmss"] = _to_hhmmss(sf.end_sec)
-            for k in ("overlap_avg", "overlap_p90", "text_avg", "occlusion_avg",
-                       "text_dominance", "motion_avg", "active_ratio", "static_ratio",
-                       "centroid_jitter", "layout_max_density_avg", "layout_dense_cell_avg",
-                       "color_shift_max", "color_shift_avg", "score",
-                       "occlusion_ratio", "duration_sec", "start_sec", "end_sec"):
-                if k in row and isinstance(row[k], float):
-                    row[k] = round(row[k], 4)
+            row = []
+            for k in _SEGMENT_CSV_FIELDS:
+                if k == "start_hhmmss":
+                    v = _to_hhmmss(sf.start_sec)
+                elif k == "end_hhmmss":
+                    v = _to_hhmmss(sf.end_sec)
+                else:
+                    v = getattr(sf, k)
+                    if k in _SEGMENT_CSV_ROUNDED and isinstance(v, float):
+                        v = round(v, 4)
+                row.append(v)
             w.writerow(row)
 
 
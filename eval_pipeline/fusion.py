@@ -21,15 +21,19 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .config import FusionConfig
-from .cv_features import GlobalCVMetrics, SegmentFeatures
+from .cv_features import LABEL_CV_FAIL, LABEL_NEEDS_VLM, GlobalCVMetrics, SegmentFeatures
 from .vlm_judge import VLMVerdict
 
+# VLM verdicts that clear a segment, and CV labels that make a segment an issue.
+_ACCEPTED_VERDICTS = frozenset({"PASS", "INTENTIONAL"})
+_ISSUE_LABELS = frozenset({LABEL_CV_FAIL, LABEL_NEEDS_VLM})
+
 
 # =====================================================================
 # Per-dimension scores
 # =====================================================================
 
-@dataclass
+@dataclass(slots=True)
 class DimensionScore:
     name: str
     score: float            # 0-1 (1 = perfect)
@@ -139,8 +143,15 @@ def _score_vlm(
         )
 
     total = len(verdicts)
-    fails = sum(1 for v in verdicts if v.vlm_verdict == "FAIL")
-    passes = sum(1 for v in verdicts if v.vlm_verdict in ("PASS", "INTENTIONAL"))
+    fails = 0
+    passes = 0
+    fail_conf = 0.0
+    for v in verdicts:
+        if v.vlm_verdict == "FAIL":
+            fails += 1
+            fail_conf += v.vlm_confidence
+        elif v.vlm_verdict in _ACCEPTED_VERDICTS:
+            passes += 1
 
     if total == 0:
         return DimensionScore("vlm_semantic", 1.0, True, "no segments reviewed")
@@ -150,9 +161,7 @@ def _score_vlm(
 
     # Weight by confidence
     if fails > 0:
-        avg_conf = sum(
-            v.vlm_confidence for v in verdicts if v.vlm_verdict == "FAIL"
-        ) / fails
+        avg_conf = fail_conf / fails
         score = max(0.0, score - 0.2 * avg_conf)
 
     details = f"vlm_pass={passes}, vlm_fail={fails}, total={total}"
@@ -173,7 +182,7 @@ def _collect_issues(
     vlm_map = {v.segment_id: v for v in verdicts}
 
     for seg in segments:
-        if seg.label not in ("cv_fail", "needs_vlm"):
+        if seg.label not in _ISSUE_LABELS:
             continue
 
         issue: Dict = {
@@ -193,9 +202,9 @@ def _collect_issues(
         # Determine final status
         if vlm_v and vlm_v.vlm_verdict == "FAIL":
             issue["final_status"] = "FAIL"
-        elif vlm_v and vlm_v.vlm_verdict in ("PASS", "INTENTIONAL"):
+        elif vlm_v and vlm_v.vlm_verdict in _ACCEPTED_VERDICTS:
             issue["final_status"] = vlm_v.vlm_verdict
-        elif seg.label == "cv_fail":
+        elif seg.label == LABEL_CV_FAIL:
             issue["final_status"] = "FAIL (CV-only)"
         else:
             issue["final_status"] = "UNCERTAIN"
@@ -253,7 +262,7 @@ def compute_report(
 
     # Issues
     report.issues = _collect_issues(segments, verdicts)
-    report.cv_fail_segments = [s.segment_id for s in segments if s.label == "cv_fail"]
+    report.cv_fail_segments = [s.segment_id for s in segments if s.label == LABEL_CV_FAIL]
     report.vlm_fail_segments = [v.segment_id for v in verdicts if v.vlm_verdict == "FAIL"]
 
     return report
@@ -263,10 +272,9 @@ def compute_report(
 # Report output
 # =====================================================================
 
-def save_report_json(report: EvalReport, path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-
-    data = {
+def report_to_dict(report: EvalReport) -> Dict:
+    """Plain-dict view of *report* (the report.json schema)."""
+    return {
         "video": report.video,
         "duration_sec": report.duration_sec,
         "total_frames": report.total_frames,
@@ -287,8 +295,12 @@ def save_report_json(report: EvalReport, path: Path) -> None:
         "vlm_fail_segments": report.vlm_fail_segments,
     }
 
+
+def save_report_json(report: EvalReport, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
     with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+        json.dump(report_to_dict(report), f, ensure_ascii=False, indent=2)
 
 
 def print_report(report: EvalReport) -> None:
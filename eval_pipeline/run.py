@@ -33,6 +33,7 @@ import json
 import os
 import sys
 import time
+from collections import Counter
 from pathlib import Path
 from typing import List
 
@@ -40,6 +41,9 @@ from dotenv import load_dotenv
 
 from .config import CVConfig, FusionConfig, PipelineConfig, VLMConfig
 from .cv_features import (
+    LABEL_CV_FAIL,
+    LABEL_LIKELY_INTENTIONAL,
+    LABEL_NEEDS_VLM,
     SegmentFeatures,
     classify_segment,
     compute_global_cv_metrics,
@@ -51,7 +55,7 @@ from .cv_features import (
     save_segment_csv,
 )
 from .vlm_judge import VLMVerdict, review_segments, save_verdicts_jsonl
-from .fusion import compute_report, print_report, save_report_json
+from .fusion import EvalReport, compute_report, print_report, save_report_json
 
 
 ROOT_DIR = Path(__file__).resolve().parent.parent
@@ -94,6 +98,7 @@ def build_parser() -> argparse.ArgumentParser:
     vlm.add_argument("--base-url", type=str, default=DEFAULT_BASE_URL, help="Custom API base URL (default: OPENAI_BASE_URL from .env/env)")
     vlm.add_argument("--model", type=str, default=DEFAULT_MODEL, help="VLM model name (default: OPENAI_MODEL from .env/env)")
     vlm.add_argument("--max-vlm-segments", type=int, default=0, help="Max segments to send to VLM (0=all)")
+    vlm.add_argument("--vlm-workers", type=int, default=4, help="Concurrent VLM requests (default: 4)")
     vlm.add_argument("--vlm-all", action="store_true", help="Send ALL segments to VLM (including likely_intentional)")
 
     # --- CV tuning ---
@@ -134,6 +139,7 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
         api_key=args.api_key,
         base_url=args.base_url,
         max_segments=args.max_vlm_segments,
+        max_workers=args.vlm_workers,
         include_cv_fail=True,
     )
 
@@ -160,8 +166,8 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
 # Single-video pipeline
 # =====================================================================
 
-def evaluate_video(video_path: Path, cfg: PipelineConfig) -> dict:
-    """Run the full pipeline on a single video.  Returns the report dict."""
+def evaluate_video_report(video_path: Path, cfg: PipelineConfig) -> EvalReport:
+    """Run the full pipeline on a single video.  Returns the EvalReport."""
 
     video_name = video_path.name
     stem = video_path.stem
@@ -208,10 +214,12 @@ def evaluate_video(video_path: Path, cfg: PipelineConfig) -> dict:
     save_segment_csv(segment_features_list, out_dir / "segments_all.csv")
 
     # Classification summary
-    n_fail = sum(1 for s in segment_features_list if s.label == "cv_fail")
-    n_intent = sum(1 for s in segment_features_list if s.label == "likely_intentional")
-    n_vlm = sum(1 for s in segment_features_list if s.label == "needs_vlm")
-    print(f"  Classification: cv_fail={n_fail}, likely_intentional={n_intent}, needs_vlm={n_vlm}")
+    label_counts = Counter(s.label for s in segment_features_list)
+    print(
+        f"  Classification: cv_fail={label_counts[LABEL_CV_FAIL]}, "
+        f"likely_intentional={label_counts[LABEL_LIKELY_INTENTIONAL]}, "
+        f"needs_vlm={label_counts[LABEL_NEEDS_VLM]}"
+    )
 
     # Extract keyframes for VLM segments
     if cfg.vlm_all:
@@ -219,7 +227,7 @@ def evaluate_video(video_path: Path, cfg: PipelineConfig) -> dict:
     else:
         vlm_segments = [
             s for s in segment_features_list
-            if s.label == "needs_vlm" or (cfg.vlm.include_cv_fail and s.label == "cv_fail")
+            if s.label == LABEL_NEEDS_VLM or (cfg.vlm.include_cv_fail and s.label == LABEL_CV_FAIL)
         ]
     frames_dir = out_dir / "vlm_payload" / "frames"
     extract_keyframes(video_path, vlm_segments, frames_dir)
@@ -272,11 +280,18 @@ def evaluate_video(video_path: Path, cfg: PipelineConfig) -> dict:
     save_report_json(report, out_dir / "report.json")
     print_report(report)
 
+    return report
+
+
+def evaluate_video(video_path: Path, cfg: PipelineConfig) -> dict:
+    """Run the full pipeline on a single video.  Returns the batch summary row."""
+
+    report = evaluate_video_report(video_path, cfg)
     return {
-        "video": video_name,
+        "video": report.video,
         "overall_score": report.overall_score,
         "overall_passed": report.overall_passed,
-        "output_dir": str(out_dir),
+        "output_dir": str(cfg.output_dir / video_path.stem),
     }
 
 
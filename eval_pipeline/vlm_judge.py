@@ -15,8 +15,10 @@ API key is injected at runtime via PipelineConfig.vlm.api_key or env var.
 from __future__ import annotations
 
 import base64
+import functools
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -29,7 +31,7 @@ from .cv_features import SegmentFeatures
 # Data container
 # =====================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VLMVerdict:
     segment_id: str
     start_sec: float
@@ -138,7 +140,7 @@ def _parse_vlm_json(text: str) -> Dict:
         obj = json.loads(text)
         if isinstance(obj, dict):
             return obj
-    except Exception:
+    except json.JSONDecodeError:
         pass
     # Fallback: find first {...}
     left = text.find("{")
@@ -148,7 +150,7 @@ def _parse_vlm_json(text: str) -> Dict:
             obj = json.loads(text[left: right + 1])
             if isinstance(obj, dict):
                 return obj
-        except Exception:
+        except json.JSONDecodeError:
             pass
     # Last resort: return raw
     return {"verdict": "UNKNOWN", "confidence": 0.0, "reason": text}
@@ -158,6 +160,72 @@ def _parse_vlm_json(text: str) -> Dict:
 # Main review function
 # =====================================================================
 
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: Optional[str]):
+    """Return a shared OpenAI client so repeated reviews reuse its connection pool."""
+    # Import OpenAI SDK
+    try:
+        from openai import OpenAI
+    except ImportError as exc:
+        raise RuntimeError(
+            "openai package not installed.  Run: pip install openai"
+        ) from exc
+
+    client_kwargs: Dict = {"api_key": api_key, "timeout": 120.0}
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return OpenAI(**client_kwargs)
+
+
+def _review_one(
+    client,
+    seg: SegmentFeatures,
+    frames_dir: Path,
+    vlm_cfg: VLMConfig,
+    video_name: str,
+) -> VLMVerdict:
+    """Send a single segment to the VLM and build its verdict."""
+    # Collect keyframe images
+    seg_dir = frames_dir / seg.segment_id
+    images = sorted(seg_dir.glob("*.jpg")) if seg_dir.exists() else []
+
+    user_content = _build_user_content(seg, images, video_name)
+
+    # Prepend system prompt into user content
+    full_content = [{"type": "input_text", "text": SYSTEM_PROMPT}] + user_content
+
+    try:
+        resp = client.responses.create(
+            model=vlm_cfg.model,
+            input=[{"role": "user", "content": full_content}],
+            stream=True,
+        )
+        # Accumulate streamed text
+        chunks: List[str] = []
+        for event in resp:
+            if hasattr(event, "type") and event.type == "response.output_text.delta":
+                chunks.append(event.delta)
+        raw_text = "".join(chunks).strip()
+    except Exception as exc:
+        raw_text = f"API_ERROR: {exc}"
+        # Nothing to parse; don't let JSON in an error body pose as a verdict.
+        parsed = {"verdict": "UNKNOWN", "confidence": 0.0, "reason": raw_text}
+    else:
+        parsed = _parse_vlm_json(raw_text)
+
+    return VLMVerdict(
+        segment_id=seg.segment_id,
+        start_sec=seg.start_sec,
+        end_sec=seg.end_sec,
+        cv_label=seg.label,
+        cv_score=seg.score,
+        vlm_verdict=str(parsed.get("verdict", "UNKNOWN")).upper(),
+        vlm_confidence=float(parsed.get("confidence", 0.0)),
+        vlm_reason=str(parsed.get("reason", "")),
+        raw_response=raw_text,
+    )
+
+
 def review_segments(
     segments: List[SegmentFeatures],
     frames_dir: Path,
@@ -170,6 +238,9 @@ def review_segments(
 
     *frames_dir* should contain sub-directories named by segment_id,
     each with start_*.jpg, mid_*.jpg, end_*.jpg keyframes.
+
+    Segments are independent, so up to ``vlm_cfg.max_workers`` requests
+    are in flight at once; verdicts are returned in segment order.
     """
 
     # Resolve API key
@@ -179,68 +250,27 @@ def review_segments(
             "No API key provided. Set VLMConfig.api_key or configure OPENAI_API_KEY in .env/env."
         )
 
-    # Import OpenAI SDK
-    try:
-        from openai import OpenAI
-    except ImportError as exc:
-        raise RuntimeError(
-            "openai package not installed.  Run: pip install openai"
-        ) from exc
-
-    client_kwargs: Dict = {"api_key": api_key, "timeout": 120.0}
-    if vlm_cfg.base_url:
-        client_kwargs["base_url"] = vlm_cfg.base_url
-    client = OpenAI(**client_kwargs)
+    client = _get_client(api_key, vlm_cfg.base_url)
 
     # Segments are pre-filtered by the caller; just apply max limit.
     to_review = list(segments)
     if vlm_cfg.max_segments > 0:
         to_review = to_review[: vlm_cfg.max_segments]
-
-    verdicts: List[VLMVerdict] = []
-
-    for i, seg in enumerate(to_review):
-        # Collect keyframe images
-        seg_dir = frames_dir / seg.segment_id
-        images = sorted(seg_dir.glob("*.jpg")) if seg_dir.exists() else []
-
-        user_content = _build_user_content(seg, images, video_name)
-
-        # Prepend system prompt into user content
-        full_content = [{"type": "input_text", "text": SYSTEM_PROMPT}] + user_content
-
-        try:
-            resp = client.responses.create(
-                model=vlm_cfg.model,
-                input=[{"role": "user", "content": full_content}],
-                stream=True,
-            )
-            # Accumulate streamed text
-            raw_text = ""
-            for event in resp:
-                if hasattr(event, "type") and event.type == "response.output_text.delta":
-                    raw_text += event.delta
-            raw_text = raw_text.strip()
-        except Exception as exc:
-            raw_text = f"API_ERROR: {exc}"
-
-        parsed = _parse_vlm_json(raw_text)
-
-        verdict = VLMVerdict(
-            segment_id=seg.segment_id,
-            start_sec=seg.start_sec,
-            end_sec=seg.end_sec,
-            cv_label=seg.label,
-            cv_score=seg.score,
-            vlm_verdict=str(parsed.get("verdict", "UNKNOWN")).upper(),
-            vlm_confidence=float(parsed.get("confidence", 0.0)),
-            vlm_reason=str(parsed.get("reason", "")),
-            raw_response=raw_text,
-        )
-        verdicts.append(verdict)
-
-        if progress_callback:
-            progress_callback(i + 1, len(to_review))
+    if not to_review:
+        return []
+
+    verdicts: List[Optional[VLMVerdict]] = [None] * len(to_review)
+    workers = max(1, min(vlm_cfg.max_workers, len(to_review)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_review_one, client, seg, frames_dir, vlm_cfg, video_name): i
+            for i, seg in enumerate(to_review)
+        }
+        for done, fut in enumerate(as_completed(futures), start=1):
+            verdicts[futures[fut]] = fut.result()
+            if progress_callback:
+                progress_callback(done, len(to_review))
 
     return verdicts
 